@@ -1,38 +1,72 @@
-from fastapi import APIRouter, Depends, HTTPException
+"""
+Portfolio analysis endpoints
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from app.services.auth import get_current_user, TokenData
 from app.services.database import db
 from app.services.portfolio_service import PortfolioService
+from app.models.holding import Holding
 from app.models.portfolio import PortfolioAnalysis
 
 router = APIRouter()
 
+# Validates a whole portfolio's holdings in one call
+_HOLDINGS_ADAPTER = TypeAdapter(list[Holding])
+
+# Recent analysis per portfolio, reused while its holdings are unchanged.
+# Holdings get new ids whenever they are written, so the id tuple acts as
+# a version; the TTL bounds how stale prices can get. Entries are kept in
+# insertion (= time) order so expired ones can be dropped from the front.
+_ANALYSIS_TTL = 60  # seconds
+_analysis_cache: dict[str, tuple[tuple[str, ...], datetime, PortfolioAnalysis]] = {}
+
+
+def _prune_analysis_cache(now: datetime):
+    """Drop expired analyses from the front of the cache"""
+    while _analysis_cache:
+        portfolio_id, (_, cached_at, _) = next(iter(_analysis_cache.items()))
+        if (now - cached_at).total_seconds() < _ANALYSIS_TTL:
+            break
+        del _analysis_cache[portfolio_id]
+
+
 @router.get("/", response_model=PortfolioAnalysis)
 async def analyze_portfolio(current_user: TokenData = Depends(get_current_user)):
     """Analyze current user's portfolio"""
     # Get portfolio with holdings
-    portfolio = await db.portfolio.find_first(
-        where={"userId": current_user.user_id},
-        include={"holdings": True}
-    )
-    
-    if not portfolio or not portfolio.holdings:
+    portfolio, portfolio_holdings = await db.portfolio_find_with_holdings(current_user.user_id)
+
+    if not portfolio or not portfolio_holdings:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No holdings to analyze. Please import or add holdings first."
         )
-    
+
+    version = tuple(h.id for h in portfolio_holdings)
+    now = datetime.utcnow()
+    _prune_analysis_cache(now)
+    cached = _analysis_cache.get(portfolio.id)
+    if cached and cached[0] == version and (now - cached[1]).total_seconds() < _ANALYSIS_TTL:
+        return cached[2]
+
     # Convert to format expected by PortfolioService
-    holdings = [
+    holdings = _HOLDINGS_ADAPTER.validate_python([
         {
             "symbol": h.symbol,
             "quantity": h.quantity,
             "purchase_price": h.purchasePrice,
+            "asset_class": h.assetClass,
         }
-        for h in portfolio.holdings
-    ]
-    
+        for h in portfolio_holdings
+    ])
+
     # Perform analysis
     portfolio_service = PortfolioService()
     analysis = await portfolio_service.analyze(holdings)
-    
+    _analysis_cache.pop(portfolio.id, None)  # re-insert so order stays by time
+    _analysis_cache[portfolio.id] = (version, now, analysis)
+
     return analysis
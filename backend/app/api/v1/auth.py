@@ -133,27 +133,25 @@ async def refresh_token(request: dict):
         )
     
     # Check session exists
+    now = datetime.utcnow()
     session = await db.session_find_by_token(refresh_token)
-    if not session or session.expiresAt < datetime.utcnow():
+    if not session or session.expiresAt < now:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Session expired"
         )
     
     # Generate new tokens
-    new_access_token = create_access_token(
-        data={"sub": payload.user_id, "email": payload.email}
-    )
-    new_refresh_token = create_refresh_token(
-        data={"sub": payload.user_id, "email": payload.email}
-    )
+    claims = {"sub": payload.user_id, "email": payload.email}
+    new_access_token = create_access_token(data=claims)
+    new_refresh_token = create_refresh_token(data=claims)
     
     # Delete old session, create new one
     await db.session_delete_many(payload.user_id)
     await db.session_create(
         userId=payload.user_id,
         token=new_refresh_token,
-        expiresAt=datetime.utcnow() + timedelta(days=7),
+        expiresAt=now + timedelta(days=7),
     )
     
     return {
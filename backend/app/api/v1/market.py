@@ -4,6 +4,7 @@ Market data endpoints
 
 from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime
+from app.services.market_data_service import get_market_data_service
 
 router = APIRouter(tags=["market"])
 
@@ -17,27 +18,8 @@ async def get_prices(symbols: str = Query(..., description="Comma-separated list
     - **Returns**: Current prices for all symbols
     """
     try:
-        import yfinance as yf
-        
         symbol_list = [s.strip() for s in symbols.split(",")]
-        prices = {}
-        
-        for symbol in symbol_list:
-            try:
-                ticker = yf.Ticker(symbol)
-                # Use fast_info for quicker access
-                info = ticker.fast_info
-                if info and 'last_price' in info:
-                    prices[symbol] = float(info['last_price'])
-                else:
-                    # Fallback to history
-                    hist = ticker.history(period='1d')
-                    if len(hist) > 0:
-                        prices[symbol] = float(hist['Close'].iloc[-1])
-                    else:
-                        prices[symbol] = None
-            except Exception as e:
-                prices[symbol] = None
+        prices = await get_market_data_service().get_prices(symbol_list)
         
         return {
             "prices": prices,
@@ -57,18 +39,9 @@ async def get_price(symbol: str):
     - **Returns**: Current price
     """
     try:
-        import yfinance as yf
-        
-        ticker = yf.Ticker(symbol)
-        info = ticker.fast_info
-        if info and 'last_price' in info:
-            price = float(info['last_price'])
-        else:
-            hist = ticker.history(period='1d')
-            if len(hist) > 0:
-                price = float(hist['Close'].iloc[-1])
-            else:
-                raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
+        price = await get_market_data_service().get_price(symbol)
+        if price is None:
+            raise HTTPException(status_code=404, detail=f"Symbol {symbol} not found")
         
         return {
             "symbol": symbol,
@@ -1,13 +1,14 @@
 """
 Migration API - Migrate localStorage portfolio data to cloud database
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from app.services.auth import get_current_user, TokenData
 from app.services.database import db
 from app.services.portfolio_service import PortfolioService
+from app.models.holding import ASSET_CLASSES
 
 router = APIRouter()
 
@@ -44,8 +45,7 @@ class HoldingMigration(BaseModel):
     @validator('asset_class')
     def validate_asset_class(cls, v):
         """Validate asset class"""
-        valid_classes = ["stock", "etf", "crypto", "mutual_fund"]
-        if v and v not in valid_classes:
+        if v and v not in ASSET_CLASSES:
             return "stock"  # Default to stock if invalid
         return v or "stock"
 
@@ -69,6 +69,7 @@ class MigrationResponse(BaseModel):
 @router.post("/", response_model=MigrationResponse)
 async def migrate_portfolio(
     request: MigrationRequest,
+    background_tasks: BackgroundTasks,
     current_user: TokenData = Depends(get_current_user)
 ):
     """
@@ -95,9 +96,6 @@ async def migrate_portfolio(
                 description="Imported from localStorage"
             )
         
-        # Clear existing holdings (fresh migration)
-        await db.holding_delete_by_portfolio(portfolio.id)
-        
         # Track migration stats
         holdings_migrated = 0
         holdings_failed = 0
@@ -108,7 +106,7 @@ async def migrate_portfolio(
         
         for holding_data in request.holdings:
             try:
-                symbol = holding_data.symbol.upper()
+                symbol = holding_data.symbol  # validator already uppercased
                 
                 # Handle duplicate symbols by merging quantities
                 if symbol in symbol_map:
@@ -137,23 +135,24 @@ async def migrate_portfolio(
                 failed_symbols.append(holding_data.symbol)
                 continue
         
-        # Save merged holdings to database
-        for symbol, data in symbol_map.items():
-            try:
-                await db.holding_create(
-                    portfolioId=portfolio.id,
-                    symbol=symbol,
-                    quantity=data['quantity'],
-                    purchasePrice=data['purchase_price'],
-                    assetClass=data['asset_class'],
-                )
-                holdings_migrated += 1
-            except Exception as e:
-                holdings_failed += 1
-                failed_symbols.append(symbol)
+        # Replace existing holdings with the merged set (fresh migration)
+        created = await db.holding_replace_many(
+            portfolio.id,
+            [
+                {
+                    "symbol": symbol,
+                    "quantity": data['quantity'],
+                    "purchasePrice": data['purchase_price'],
+                    "assetClass": data['asset_class'],
+                }
+                for symbol, data in symbol_map.items()
+            ],
+        )
+        holdings_migrated = len(created)
         
-        # Log migration to audit log
-        await db.audit_log_create(
+        # Log migration to audit log once the response has been sent
+        background_tasks.add_task(
+            db.audit_log_create,
             userId=current_user.user_id,
             action="portfolio_migration",
             details={
@@ -199,7 +198,7 @@ async def get_migration_status(
     if the migration prompt should be shown.
     """
     # Check if user has a portfolio with holdings
-    portfolio = await db.portfolio_find_by_user(current_user.user_id)
+    portfolio, holdings = await db.portfolio_find_with_holdings(current_user.user_id)
     
     if not portfolio:
         return {
@@ -208,8 +207,6 @@ async def get_migration_status(
             "needs_migration_check": True
         }
     
-    holdings = await db.holding_find_by_portfolio(portfolio.id)
-    
     return {
         "has_cloud_portfolio": True,
         "holdings_count": len(holdings),
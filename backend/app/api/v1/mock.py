@@ -4,6 +4,7 @@ Mock Data API Endpoints for KlyrSignals
 Provides endpoints for loading demo data for screenshots and testing.
 """
 
+from datetime import datetime
 from fastapi import APIRouter
 from app.data.mock_portfolio import MOCK_PORTFOLIO, MOCK_ANALYSIS
 
@@ -25,8 +26,6 @@ async def get_mock_analysis():
 @router.post("/load")
 async def load_mock_data():
     """Load mock data into localStorage (returns data for frontend to store)"""
-    from datetime import datetime
-    
     return {
         "portfolio": {
             "holdings": MOCK_PORTFOLIO["holdings"],
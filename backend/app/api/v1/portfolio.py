@@ -1,21 +1,37 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, validator
 from typing import List, Optional
 from app.services.auth import get_current_user, TokenData
 from app.services.database import db
+from app.models.holding import ASSET_CLASSES
 
 router = APIRouter()
 
 class HoldingImport(BaseModel):
-    symbol: str
-    quantity: float
-    purchase_price: float
+    # Same constraints as Holding, so stored rows always pass analysis
+    symbol: str = Field(..., min_length=1, max_length=10)
+    quantity: float = Field(..., gt=0)
+    purchase_price: float = Field(..., gt=0)
     asset_class: Optional[str] = "stock"
+    
+    @validator('symbol')
+    def validate_symbol(cls, v):
+        """Validate symbol format"""
+        if not v.strip():
+            raise ValueError("Symbol cannot be empty")
+        return v.strip().upper()
+    
+    @validator('asset_class')
+    def validate_asset_class(cls, v):
+        """Fall back to stock for unknown asset classes"""
+        if v and v not in ASSET_CLASSES:
+            return "stock"
+        return v or "stock"
 
 @router.get("/")
 async def get_portfolio(current_user: TokenData = Depends(get_current_user)):
     """Get current user's portfolio"""
-    portfolio = await db.portfolio_find_by_user(current_user.user_id)
+    portfolio, holdings = await db.portfolio_find_with_holdings(current_user.user_id)
     
     if not portfolio:
         # Create empty portfolio
@@ -24,8 +40,6 @@ async def get_portfolio(current_user: TokenData = Depends(get_current_user)):
             name="My Portfolio",
         )
     
-    holdings = await db.holding_find_by_portfolio(portfolio.id)
-    
     return {
         "id": portfolio.id,
         "userId": portfolio.userId,
@@ -60,17 +74,18 @@ async def import_portfolio(
             name="My Portfolio",
         )
     
-    # Clear existing holdings
-    await db.holding_delete_by_portfolio(portfolio.id)
-    
-    # Add new holdings
-    for holding_data in holdings:
-        await db.holding_create(
-            portfolioId=portfolio.id,
-            symbol=holding_data.symbol.upper(),
-            quantity=holding_data.quantity,
-            purchasePrice=holding_data.purchase_price,
-            assetClass=holding_data.asset_class or "stock",
-        )
+    # Replace existing holdings
+    await db.holding_replace_many(
+        portfolio.id,
+        [
+            {
+                "symbol": holding_data.symbol,
+                "quantity": holding_data.quantity,
+                "purchasePrice": holding_data.purchase_price,
+                "assetClass": holding_data.asset_class or "stock",
+            }
+            for holding_data in holdings
+        ],
+    )
     
     return {"success": True, "portfolioId": portfolio.id}
@@ -129,6 +129,15 @@ ETF_SECTOR_MAP = {
     'XLC': 'Communication',
 }
 
+# Combined symbol lookup (ETF map takes precedence over the stock map)
+_SYMBOL_SECTOR = {**SECTOR_MAP, **ETF_SECTOR_MAP}
+
+# Sector fallback for symbols not in either map
+_ASSET_CLASS_SECTOR = {
+    'etf': 'Broad Market',
+    'crypto': 'Cryptocurrency',
+}
+
 
 def get_sector(symbol: str, asset_class: str = "stock") -> Optional[str]:
     """
@@ -141,26 +150,12 @@ def get_sector(symbol: str, asset_class: str = "stock") -> Optional[str]:
     Returns:
         Sector name or None if not found
     """
-    symbol_upper = symbol.upper()
-    
-    # Check ETF map first
-    if symbol_upper in ETF_SECTOR_MAP:
-        return ETF_SECTOR_MAP[symbol_upper]
-    
-    # Check stock sector map
-    if symbol_upper in SECTOR_MAP:
-        return SECTOR_MAP[symbol_upper]
-    
-    # For ETFs, return based on asset class
-    if asset_class == "etf":
-        return "Broad Market"
+    sector = _SYMBOL_SECTOR.get(symbol.upper())
+    if sector is not None:
+        return sector
     
-    # For crypto
-    if asset_class == "crypto":
-        return "Cryptocurrency"
-    
-    # Unknown
-    return "Other"
+    # Fall back to asset class (ETFs -> Broad Market, crypto -> Cryptocurrency)
+    return _ASSET_CLASS_SECTOR.get(asset_class, "Other")
 
 
 def calculate_allocation(
@@ -177,43 +172,50 @@ def calculate_allocation(
     Returns:
         Tuple of (asset_class_allocation, sector_allocation) as percentages
     """
-    # Calculate value for each holding
-    holding_values = []
+    # Accumulate asset class and sector totals in a single pass
+    asset_class_totals: dict[str, float] = {}
+    sector_totals: dict[str, float] = {}
+    total_value = 0.0
     for holding in holdings:
-        price = prices.get(holding.symbol, holding.purchase_price)
-        value = holding.quantity * price
-        sector = get_sector(holding.symbol, holding.asset_class)
-        holding_values.append({
-            'symbol': holding.symbol,
-            'value': value,
-            'asset_class': holding.asset_class,
-            'sector': sector or 'Other',
-        })
-    
-    total_value = sum(h['value'] for h in holding_values)
+        value = holding.quantity * prices.get(holding.symbol, holding.purchase_price)
+        total_value += value
+        ac = holding.asset_class
+        asset_class_totals[ac] = asset_class_totals.get(ac, 0) + value
+        sector = get_sector(holding.symbol, holding.asset_class) or 'Other'
+        sector_totals[sector] = sector_totals.get(sector, 0) + value
+    
     if total_value == 0:
         return {}, {}
     
-    # Calculate asset class allocation
-    asset_class_totals = {}
-    for h in holding_values:
-        ac = h['asset_class']
-        asset_class_totals[ac] = asset_class_totals.get(ac, 0) + h['value']
-    
     asset_class_allocation = {
         ac: round((value / total_value) * 100, 2)
         for ac, value in asset_class_totals.items()
     }
     
-    # Calculate sector allocation
-    sector_totals = {}
-    for h in holding_values:
-        sector = h['sector']
-        sector_totals[sector] = sector_totals.get(sector, 0) + h['value']
-    
     sector_allocation = {
         sector: round((value / total_value) * 100, 2)
         for sector, value in sector_totals.items()
     }
     
     return asset_class_allocation, sector_allocation
+
+
+def holding_weights(
+    holdings: list[Holding],
+    prices: dict[str, float]
+) -> list[float]:
+    """
+    Calculate each holding's share of total portfolio value.
+    
+    Args:
+        holdings: List of holdings
+        prices: Current prices for each symbol
+        
+    Returns:
+        Percentages in holdings order (empty if the portfolio has no value)
+    """
+    values = [h.quantity * prices.get(h.symbol, h.purchase_price) for h in holdings]
+    total_value = sum(values)
+    if total_value == 0:
+        return []
+    return [(value / total_value) * 100 for value in values]
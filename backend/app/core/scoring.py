@@ -3,7 +3,7 @@ Risk scoring algorithms
 """
 
 from app.models.holding import Holding
-from app.core.allocation import calculate_allocation
+from app.core.allocation import calculate_allocation, get_sector, holding_weights
 from typing import Optional
 
 
@@ -11,7 +11,8 @@ def calculate_concentration_risk(
     asset_class_allocation: dict[str, float],
     sector_allocation: dict[str, float],
     holdings: list[Holding],
-    prices: dict[str, float]
+    prices: dict[str, float],
+    weights: Optional[list[float]] = None
 ) -> int:
     """
     Calculate concentration risk score (0-50 points).
@@ -28,26 +29,21 @@ def calculate_concentration_risk(
         sector_allocation: Allocation by sector (%)
         holdings: List of holdings
         prices: Current prices
+        weights: Precomputed per-holding weights (%), computed if omitted
         
     Returns:
         Concentration risk score (0-50)
     """
     score = 0
     
-    # Calculate total portfolio value
-    total_value = sum(
-        h.quantity * prices.get(h.symbol, h.purchase_price)
-        for h in holdings
-    )
+    if weights is None:
+        weights = holding_weights(holdings, prices)
     
-    if total_value == 0:
+    if not weights:
         return 0
     
     # Check single stock concentration
-    for holding in holdings:
-        value = holding.quantity * prices.get(holding.symbol, holding.purchase_price)
-        pct = (value / total_value) * 100
-        
+    for pct in weights:
         if pct > 20:
             score += 20
         elif pct > 10:
@@ -70,7 +66,8 @@ def calculate_concentration_risk(
 
 def calculate_volatility_risk(
     holdings: list[Holding],
-    prices: dict[str, float]
+    prices: dict[str, float],
+    weights: Optional[list[float]] = None
 ) -> int:
     """
     Calculate volatility risk score (0-30 points).
@@ -83,45 +80,40 @@ def calculate_volatility_risk(
     Args:
         holdings: List of holdings
         prices: Current prices
+        weights: Precomputed per-holding weights (%), computed if omitted
         
     Returns:
         Volatility risk score (0-30)
     """
     score = 0
     
-    # Calculate total value
-    total_value = sum(
-        h.quantity * prices.get(h.symbol, h.purchase_price)
-        for h in holdings
-    )
+    # Sum total, crypto and tech exposure in a single pass
+    total_value = 0.0
+    crypto_value = 0.0
+    tech_value = 0.0
+    for h in holdings:
+        value = h.quantity * prices.get(h.symbol, h.purchase_price)
+        total_value += value
+        if h.asset_class == 'crypto':
+            crypto_value += value
+        if get_sector(h.symbol, h.asset_class) == 'Technology':
+            tech_value += value
     
     if total_value == 0:
         return 0
     
     # Check crypto exposure
-    crypto_value = sum(
-        h.quantity * prices.get(h.symbol, h.purchase_price)
-        for h in holdings if h.asset_class == 'crypto'
-    )
     crypto_pct = (crypto_value / total_value) * 100
     if crypto_pct > 50:
         score += 15
     
     # Check single stock volatility
-    for holding in holdings:
-        value = holding.quantity * prices.get(holding.symbol, holding.purchase_price)
-        pct = (value / total_value) * 100
-        if pct > 15:
-            score += 8
-            break
+    if weights is None:
+        weights = holding_weights(holdings, prices)
+    if any(pct > 15 for pct in weights):
+        score += 8
     
     # Check tech sector concentration (proxy for volatility)
-    from app.core.allocation import get_sector
-    tech_value = sum(
-        h.quantity * prices.get(h.symbol, h.purchase_price)
-        for h in holdings
-        if get_sector(h.symbol, h.asset_class) == 'Technology'
-    )
     tech_pct = (tech_value / total_value) * 100
     if tech_pct > 60:
         score += 7
@@ -148,10 +140,13 @@ def calculate_correlation_risk(
     Returns:
         Correlation risk score (0-20)
     """
+    if not sector_allocation:
+        return 0
+    
     score = 0
     
     # Check single sector dominance
-    max_sector_pct = max(sector_allocation.values()) if sector_allocation else 0
+    max_sector_pct = max(sector_allocation.values())
     
     if max_sector_pct > 50:
         score += 20
@@ -170,7 +165,9 @@ def calculate_correlation_risk(
 
 def calculate_risk_score(
     holdings: list[Holding],
-    prices: dict[str, float]
+    prices: dict[str, float],
+    allocation: Optional[tuple[dict[str, float], dict[str, float]]] = None,
+    weights: Optional[list[float]] = None
 ) -> tuple[int, dict[str, int]]:
     """
     Calculate composite risk score (0-100).
@@ -180,20 +177,25 @@ def calculate_risk_score(
     Args:
         holdings: List of holdings
         prices: Current prices
+        allocation: Precomputed (asset_class_allocation, sector_allocation),
+            computed from holdings and prices if omitted
+        weights: Precomputed per-holding weights (%), computed if omitted
         
     Returns:
         Tuple of (total_risk_score, risk_breakdown)
     """
-    from app.core.allocation import calculate_allocation
-    
     # Calculate allocations
-    asset_class_allocation, sector_allocation = calculate_allocation(holdings, prices)
+    if allocation is None:
+        allocation = calculate_allocation(holdings, prices)
+    asset_class_allocation, sector_allocation = allocation
     
     # Calculate component scores
+    if weights is None:
+        weights = holding_weights(holdings, prices)
     concentration_risk = calculate_concentration_risk(
-        asset_class_allocation, sector_allocation, holdings, prices
+        asset_class_allocation, sector_allocation, holdings, prices, weights
     )
-    volatility_risk = calculate_volatility_risk(holdings, prices)
+    volatility_risk = calculate_volatility_risk(holdings, prices, weights)
     correlation_risk = calculate_correlation_risk(holdings, sector_allocation)
     
     # Calculate total
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime
 
 from app.services.database import connect_db, disconnect_db
+from app.services.oauth_service import oauth_service
 from app.api.v1 import auth, users, portfolio, analysis, market, health, migration, oauth
 
 @asynccontextmanager
@@ -17,6 +18,7 @@ async def lifespan(app: FastAPI):
     await connect_db()
     yield
     # Shutdown
+    await oauth_service.aclose()
     await disconnect_db()
 
 # Create FastAPI app
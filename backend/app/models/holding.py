@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 from datetime import date
 from typing import Optional, Literal
 
+ASSET_CLASSES = frozenset({"stock", "etf", "crypto", "mutual_fund"})
+
 
 class Holding(BaseModel):
     """
@@ -3,12 +3,13 @@ Simple in-memory database for development.
 Replace with PostgreSQL/Prisma in production.
 """
 import asyncio
+import heapq
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: str
     email: str
@@ -19,7 +20,7 @@ class User:
     createdAt: datetime = field(default_factory=datetime.utcnow)
     updatedAt: datetime = field(default_factory=datetime.utcnow)
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """OAuth account linked to User"""
     id: str
@@ -35,7 +36,7 @@ class Account:
     createdAt: datetime = field(default_factory=datetime.utcnow)
     updatedAt: datetime = field(default_factory=datetime.utcnow)
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     id: str
     userId: str
@@ -45,7 +46,7 @@ class Session:
     userAgent: Optional[str] = None
     ipAddress: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     id: str
     userId: str
@@ -55,7 +56,7 @@ class Portfolio:
     createdAt: datetime = field(default_factory=datetime.utcnow)
     updatedAt: datetime = field(default_factory=datetime.utcnow)
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     id: str
     portfolioId: str
@@ -67,7 +68,7 @@ class Holding:
     createdAt: datetime = field(default_factory=datetime.utcnow)
     updatedAt: datetime = field(default_factory=datetime.utcnow)
 
-@dataclass
+@dataclass(slots=True)
 class AuditLog:
     id: str
     userId: str
@@ -78,35 +79,46 @@ class AuditLog:
     userAgent: Optional[str] = None
 
 class InMemoryDB:
+    # Writes take _lock. Reads don't: no write awaits mid-update, so on the
+    # event loop a read can never observe a half-applied write.
     def __init__(self):
         self.users: Dict[str, User] = {}
         self.accounts: Dict[str, Account] = {}  # OAuth accounts
         self.sessions: Dict[str, Session] = {}
         self.portfolios: Dict[str, Portfolio] = {}
         self.holdings: Dict[str, Holding] = {}
+        self._holdings_by_portfolio: Dict[str, Dict[str, Holding]] = {}
         self.audit_logs: Dict[str, AuditLog] = {}
         self._lock = asyncio.Lock()
+        
+        # Secondary indexes (first match wins, same as the old linear scans)
+        self._users_by_email: Dict[str, User] = {}
+        self._sessions_by_token: Dict[str, Session] = {}
+        self._sessions_by_user: Dict[str, Dict[str, Session]] = {}
+        self._portfolios_by_user: Dict[str, Portfolio] = {}
+        self._accounts_by_provider_id: Dict[Tuple[str, str], Account] = {}
+        self._accounts_by_user: Dict[str, Dict[str, Account]] = {}
+        self._audit_logs_by_user: Dict[str, List[AuditLog]] = {}
     
     async def user_find_by_email(self, email: str) -> Optional[User]:
-        async with self._lock:
-            for user in self.users.values():
-                if user.email == email:
-                    return user
-            return None
+        return self._users_by_email.get(email)
     
     async def user_find_by_id(self, user_id: str) -> Optional[User]:
-        async with self._lock:
-            return self.users.get(user_id)
+        return self.users.get(user_id)
     
     async def user_create(self, email: str, passwordHash: str, name: str) -> User:
         async with self._lock:
+            now = datetime.utcnow()
             user = User(
                 id=str(uuid.uuid4()),
                 email=email,
                 passwordHash=passwordHash,
-                name=name
+                name=name,
+                createdAt=now,
+                updatedAt=now,
             )
             self.users[user.id] = user
+            self._users_by_email.setdefault(email, user)
             return user
     
     async def session_create(self, userId: str, token: str, expiresAt: datetime) -> Session:
@@ -118,62 +130,99 @@ class InMemoryDB:
                 expiresAt=expiresAt
             )
             self.sessions[session.id] = session
+            self._sessions_by_token.setdefault(token, session)
+            self._sessions_by_user.setdefault(userId, {})[session.id] = session
             return session
     
     async def session_find_by_token(self, token: str) -> Optional[Session]:
-        async with self._lock:
-            for session in self.sessions.values():
-                if session.token == token:
-                    return session
-            return None
+        return self._sessions_by_token.get(token)
     
     async def session_delete_many(self, userId: str):
         async with self._lock:
-            to_delete = [k for k, v in self.sessions.items() if v.userId == userId]
-            for k in to_delete:
+            for k, session in self._sessions_by_user.pop(userId, {}).items():
                 del self.sessions[k]
+                if self._sessions_by_token.get(session.token) is session:
+                    del self._sessions_by_token[session.token]
     
     async def portfolio_find_by_user(self, userId: str) -> Optional[Portfolio]:
-        async with self._lock:
-            for portfolio in self.portfolios.values():
-                if portfolio.userId == userId:
-                    return portfolio
-            return None
+        return self._portfolios_by_user.get(userId)
+    
+    async def portfolio_find_with_holdings(
+        self, userId: str
+    ) -> Tuple[Optional[Portfolio], List[Holding]]:
+        """Get a user's portfolio and its holdings in a single lookup"""
+        portfolio = self._portfolios_by_user.get(userId)
+        if not portfolio:
+            return None, []
+        holdings = self._holdings_by_portfolio.get(portfolio.id, {})
+        return portfolio, list(holdings.values())
     
     async def portfolio_create(self, userId: str, name: str, description: Optional[str] = None) -> Portfolio:
         async with self._lock:
+            now = datetime.utcnow()
             portfolio = Portfolio(
                 id=str(uuid.uuid4()),
                 userId=userId,
                 name=name,
-                description=description
+                description=description,
+                createdAt=now,
+                updatedAt=now,
             )
             self.portfolios[portfolio.id] = portfolio
+            self._portfolios_by_user.setdefault(userId, portfolio)
             return portfolio
     
     async def holding_create(self, portfolioId: str, symbol: str, quantity: float, 
                             purchasePrice: float, assetClass: str = "stock") -> Holding:
         async with self._lock:
+            now = datetime.utcnow()
             holding = Holding(
                 id=str(uuid.uuid4()),
                 portfolioId=portfolioId,
                 symbol=symbol.upper(),
                 quantity=quantity,
                 purchasePrice=purchasePrice,
-                assetClass=assetClass
+                assetClass=assetClass,
+                createdAt=now,
+                updatedAt=now,
             )
             self.holdings[holding.id] = holding
+            self._holdings_by_portfolio.setdefault(portfolioId, {})[holding.id] = holding
             return holding
     
+    async def holding_replace_many(
+        self, portfolioId: str, holdings: List[Dict[str, Any]]
+    ) -> List[Holding]:
+        """Replace all holdings of a portfolio in one step"""
+        async with self._lock:
+            for k in self._holdings_by_portfolio.pop(portfolioId, {}):
+                del self.holdings[k]
+            now = datetime.utcnow()
+            bucket = self._holdings_by_portfolio[portfolioId] = {}
+            created = []
+            for data in holdings:
+                holding = Holding(
+                    id=str(uuid.uuid4()),
+                    portfolioId=portfolioId,
+                    symbol=data["symbol"].upper(),
+                    quantity=data["quantity"],
+                    purchasePrice=data["purchasePrice"],
+                    assetClass=data.get("assetClass", "stock"),
+                    createdAt=now,
+                    updatedAt=now,
+                )
+                self.holdings[holding.id] = holding
+                bucket[holding.id] = holding
+                created.append(holding)
+            return created
+    
     async def holding_delete_by_portfolio(self, portfolioId: str):
         async with self._lock:
-            to_delete = [k for k, v in self.holdings.items() if v.portfolioId == portfolioId]
-            for k in to_delete:
+            for k in self._holdings_by_portfolio.pop(portfolioId, {}):
                 del self.holdings[k]
     
     async def holding_find_by_portfolio(self, portfolioId: str) -> List[Holding]:
-        async with self._lock:
-            return [h for h in self.holdings.values() if h.portfolioId == portfolioId]
+        return list(self._holdings_by_portfolio.get(portfolioId, {}).values())
     
     async def audit_log_create(
         self,
@@ -194,29 +243,23 @@ class InMemoryDB:
                 userAgent=userAgent
             )
             self.audit_logs[audit_log.id] = audit_log
+            self._audit_logs_by_user.setdefault(userId, []).append(audit_log)
             return audit_log
     
     async def audit_log_find_by_user(self, userId: str, limit: int = 100) -> List[AuditLog]:
         """Get audit logs for a user"""
-        async with self._lock:
-            logs = [log for log in self.audit_logs.values() if log.userId == userId]
-            logs.sort(key=lambda x: x.timestamp, reverse=True)
-            return logs[:limit]
+        logs = self._audit_logs_by_user.get(userId, [])
+        return heapq.nlargest(limit, logs, key=lambda x: x.timestamp)
     
     async def account_find_by_provider_and_id(
         self, provider: str, providerAccountId: str
     ) -> Optional[Account]:
         """Find OAuth account by provider and provider's user ID"""
-        async with self._lock:
-            for account in self.accounts.values():
-                if account.provider == provider and account.providerAccountId == providerAccountId:
-                    return account
-            return None
+        return self._accounts_by_provider_id.get((provider, providerAccountId))
     
     async def account_find_by_user(self, userId: str) -> List[Account]:
         """Get all OAuth accounts linked to a user"""
-        async with self._lock:
-            return [a for a in self.accounts.values() if a.userId == userId]
+        return list(self._accounts_by_user.get(userId, {}).values())
     
     async def account_create(
         self,
@@ -232,6 +275,7 @@ class InMemoryDB:
     ) -> Account:
         """Create OAuth account linked to user"""
         async with self._lock:
+            now = datetime.utcnow()
             account = Account(
                 id=str(uuid.uuid4()),
                 userId=userId,
@@ -243,8 +287,12 @@ class InMemoryDB:
                 scope=scope,
                 tokenType=tokenType,
                 idToken=idToken,
+                createdAt=now,
+                updatedAt=now,
             )
             self.accounts[account.id] = account
+            self._accounts_by_provider_id.setdefault((provider, providerAccountId), account)
+            self._accounts_by_user.setdefault(userId, {})[account.id] = account
             return account
     
     async def account_update_tokens(
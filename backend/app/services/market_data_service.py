@@ -2,21 +2,32 @@
 Market Data Service - Fetches prices from yfinance with caching
 """
 
+import asyncio
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
+# Dedicated pool for blocking yfinance calls, so a large portfolio can't
+# starve the default executor used elsewhere in the app
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yfinance")
+
 
 class MarketDataService:
     """
     Service for fetching market data from Yahoo Finance.
     
-    Implements caching to reduce API calls (15-minute TTL).
+    Implements caching to reduce API calls (15-minute TTL). Symbols that
+    return no price are remembered for a shorter TTL so unknown tickers
+    are not looked up again on every request.
     """
     
     def __init__(self):
         self.cache: dict[str, tuple[float, datetime]] = {}
         self.cache_ttl = 900  # 15 minutes in seconds
+        self.missing: dict[str, datetime] = {}
+        self.missing_ttl = 300  # 5 minutes in seconds
+        self._inflight: dict[str, asyncio.Future] = {}
     
     async def get_prices(self, symbols: list[str]) -> dict[str, Optional[float]]:
         """
@@ -29,9 +40,14 @@ class MarketDataService:
             Dictionary mapping symbols to prices (None if not found)
         """
         prices = {}
+        to_fetch = []
         now = datetime.utcnow()
+        self._prune_missing(now)
         
         for symbol in symbols:
+            if symbol in prices:
+                continue  # duplicate symbol, already resolved or queued
+            
             # Check cache first
             if symbol in self.cache:
                 cached_price, cached_time = self.cache[symbol]
@@ -39,17 +55,67 @@ class MarketDataService:
                     prices[symbol] = cached_price
                     continue
             
-            # Fetch from yfinance
-            try:
-                price = self._fetch_price(symbol)
-                if price is not None:
-                    self.cache[symbol] = (price, now)
-                prices[symbol] = price
-            except Exception:
-                prices[symbol] = None
+            # Skip symbols that recently had no price
+            missing_since = self.missing.get(symbol)
+            if missing_since:
+                if (now - missing_since).total_seconds() < self.missing_ttl:
+                    prices[symbol] = None
+                    continue
+                del self.missing[symbol]
+            
+            prices[symbol] = None
+            to_fetch.append(symbol)
+        
+        # Fetch misses from yfinance concurrently (each call blocks on network I/O),
+        # joining any fetch another request already has in flight for the symbol
+        results = await asyncio.gather(
+            *(asyncio.shield(self._fetch_once(symbol)) for symbol in to_fetch),
+            return_exceptions=True,
+        )
+        for symbol, price in zip(to_fetch, results):
+            if isinstance(price, Exception):
+                continue
+            if price is not None:
+                self.cache[symbol] = (price, now)
+                self.missing.pop(symbol, None)
+            else:
+                self.missing.pop(symbol, None)  # re-insert so order stays by time
+                self.missing[symbol] = now
+            prices[symbol] = price
         
         return prices
     
+    def _prune_missing(self, now: datetime):
+        """Drop expired entries from the front of the (time-ordered) missing map"""
+        while self.missing:
+            symbol, missing_since = next(iter(self.missing.items()))
+            if (now - missing_since).total_seconds() < self.missing_ttl:
+                break
+            del self.missing[symbol]
+    
+    async def get_price(self, symbol: str) -> Optional[float]:
+        """
+        Get current price for a single symbol.
+        
+        Args:
+            symbol: Ticker symbol
+            
+        Returns:
+            Current price or None if not found
+        """
+        prices = await self.get_prices([symbol])
+        return prices[symbol]
+    
+    def _fetch_once(self, symbol: str) -> asyncio.Future:
+        """Get the in-flight fetch for a symbol, starting one if there is none"""
+        future = self._inflight.get(symbol)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(_FETCH_POOL, self._fetch_price, symbol)
+            self._inflight[symbol] = future
+            future.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+        return future
+    
     def _fetch_price(self, symbol: str) -> Optional[float]:
         """
         Fetch price for a single symbol from yfinance.
@@ -79,6 +145,7 @@ class MarketDataService:
     def clear_cache(self):
         """Clear the price cache"""
         self.cache.clear()
+        self.missing.clear()
     
     def get_cache_size(self) -> int:
         """Get number of cached symbols"""
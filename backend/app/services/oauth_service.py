@@ -3,6 +3,7 @@ OAuth Service - Handles OAuth2 authentication with Google and GitHub
 """
 import os
 import httpx
+import orjson
 from authlib.integrations.httpx_client import AsyncOAuth2Client
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
@@ -25,6 +26,31 @@ class OAuthService:
         self.github_redirect_uri = os.getenv(
             "GITHUB_REDIRECT_URI", "http://localhost:3000/api/auth/callback/github"
         )
+        
+        # Shared connection pool for all provider calls. The per-request
+        # OAuth clients are built on it and are not closed themselves,
+        # since closing an httpx client also closes its transport.
+        self._transport: Optional[httpx.AsyncBaseTransport] = None
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    def _get_transport(self) -> httpx.AsyncBaseTransport:
+        """Get or create the shared transport"""
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        return self._transport
+    
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client for user info requests"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(transport=self._get_transport())
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared connection pool"""
+        if self._transport is not None:
+            await self._transport.aclose()
+        self._transport = None
+        self._http = None
     
     def get_google_oauth_client(self) -> AsyncOAuth2Client:
         """Create Google OAuth2 client"""
@@ -33,6 +59,7 @@ class OAuthService:
             client_secret=self.google_client_secret,
             redirect_uri=self.google_redirect_uri,
             scope=["openid", "email", "profile"],
+            transport=self._get_transport(),
         )
     
     def get_github_oauth_client(self) -> AsyncOAuth2Client:
@@ -42,6 +69,7 @@ class OAuthService:
             client_secret=self.github_client_secret,
             redirect_uri=self.github_redirect_uri,
             scope=["user:email"],
+            transport=self._get_transport(),
         )
     
     def get_google_authorization_url(self, state: str) -> str:
@@ -67,81 +95,76 @@ class OAuthService:
         """Exchange Google authorization code for tokens"""
         client = self.get_google_oauth_client()
         
-        async with httpx.AsyncClient() as http:
-            token = await client.fetch_token(
-                "https://oauth2.googleapis.com/token",
-                authorization_response=f"{self.google_redirect_uri}?code={code}",
-                http_client=http,
-            )
-            
-            # Get user info
-            async with http.stream('GET', 
-                "https://www.googleapis.com/oauth2/v2/userinfo",
-                headers={"Authorization": f"Bearer {token['access_token']}"}
-            ) as resp:
-                user_info = await resp.aread()
-                import json
-                user_data = json.loads(user_info)
-            
-            return {
-                "provider": "google",
-                "provider_account_id": user_data.get("id"),
-                "email": user_data.get("email"),
-                "name": user_data.get("name"),
-                "avatar_url": user_data.get("picture"),
-                "email_verified": user_data.get("verified_email", False),
-                "access_token": token.get("access_token"),
-                "refresh_token": token.get("refresh_token"),
-                "expires_at": datetime.utcnow() + timedelta(seconds=token.get("expires_in", 3600)),
-            }
+        token = await client.fetch_token(
+            "https://oauth2.googleapis.com/token",
+            authorization_response=f"{self.google_redirect_uri}?code={code}",
+        )
+        
+        # Get user info
+        http = self._get_http_client()
+        async with http.stream('GET', 
+            "https://www.googleapis.com/oauth2/v2/userinfo",
+            headers={"Authorization": f"Bearer {token['access_token']}"}
+        ) as resp:
+            user_info = await resp.aread()
+            user_data = orjson.loads(user_info)
+        
+        return {
+            "provider": "google",
+            "provider_account_id": user_data.get("id"),
+            "email": user_data.get("email"),
+            "name": user_data.get("name"),
+            "avatar_url": user_data.get("picture"),
+            "email_verified": user_data.get("verified_email", False),
+            "access_token": token.get("access_token"),
+            "refresh_token": token.get("refresh_token"),
+            "expires_at": datetime.utcnow() + timedelta(seconds=token.get("expires_in", 3600)),
+        }
     
     async def exchange_github_code(self, code: str) -> Dict[str, Any]:
         """Exchange GitHub authorization code for tokens"""
         client = self.get_github_oauth_client()
         
-        async with httpx.AsyncClient() as http:
-            token = await client.fetch_token(
-                "https://github.com/login/oauth/access_token",
-                authorization_response=f"{self.github_redirect_uri}?code={code}",
-                http_client=http,
-            )
-            
-            # Get user info
+        token = await client.fetch_token(
+            "https://github.com/login/oauth/access_token",
+            authorization_response=f"{self.github_redirect_uri}?code={code}",
+        )
+        
+        # Get user info
+        http = self._get_http_client()
+        async with http.stream('GET',
+            "https://api.github.com/user",
+            headers={"Authorization": f"token {token['access_token']}"}
+        ) as resp:
+            user_info = await resp.aread()
+            user_data = orjson.loads(user_info)
+        
+        # Get email if not in user data
+        email = user_data.get("email")
+        if not email:
             async with http.stream('GET',
-                "https://api.github.com/user",
+                "https://api.github.com/user/emails",
                 headers={"Authorization": f"token {token['access_token']}"}
-            ) as resp:
-                user_info = await resp.aread()
-                import json
-                user_data = json.loads(user_info)
-            
-            # Get email if not in user data
-            email = user_data.get("email")
-            if not email:
-                async with http.stream('GET',
-                    "https://api.github.com/user/emails",
-                    headers={"Authorization": f"token {token['access_token']}"}
-                ) as email_resp:
-                    email_data = await email_resp.aread()
-                    import json
-                    emails = json.loads(email_data)
-                    # Get primary email
-                    for e in emails:
-                        if e.get("primary"):
-                            email = e.get("email")
-                            break
-            
-            return {
-                "provider": "github",
-                "provider_account_id": str(user_data.get("id")),
-                "email": email,
-                "name": user_data.get("name") or user_data.get("login"),
-                "avatar_url": user_data.get("avatar_url"),
-                "email_verified": True,  # GitHub emails are verified
-                "access_token": token.get("access_token"),
-                "refresh_token": None,  # GitHub doesn't provide refresh tokens
-                "expires_at": None,  # GitHub tokens don't expire
-            }
+            ) as email_resp:
+                email_data = await email_resp.aread()
+                emails = orjson.loads(email_data)
+                # Get primary email
+                for e in emails:
+                    if e.get("primary"):
+                        email = e.get("email")
+                        break
+        
+        return {
+            "provider": "github",
+            "provider_account_id": str(user_data.get("id")),
+            "email": email,
+            "name": user_data.get("name") or user_data.get("login"),
+            "avatar_url": user_data.get("avatar_url"),
+            "email_verified": True,  # GitHub emails are verified
+            "access_token": token.get("access_token"),
+            "refresh_token": None,  # GitHub doesn't provide refresh tokens
+            "expires_at": None,  # GitHub tokens don't expire
+        }
     
     async def refresh_google_token(
         self, refresh_token: str
@@ -149,20 +172,18 @@ class OAuthService:
         """Refresh Google access token"""
         client = self.get_google_oauth_client()
         
-        async with httpx.AsyncClient() as http:
-            try:
-                token = await client.refresh_token(
-                    "https://oauth2.googleapis.com/token",
-                    refresh_token=refresh_token,
-                    http_client=http,
-                )
-                return {
-                    "access_token": token.get("access_token"),
-                    "refresh_token": token.get("refresh_token"),
-                    "expires_at": datetime.utcnow() + timedelta(seconds=token.get("expires_in", 3600)),
-                }
-            except Exception:
-                return None
+        try:
+            token = await client.refresh_token(
+                "https://oauth2.googleapis.com/token",
+                refresh_token=refresh_token,
+            )
+            return {
+                "access_token": token.get("access_token"),
+                "refresh_token": token.get("refresh_token"),
+                "expires_at": datetime.utcnow() + timedelta(seconds=token.get("expires_in", 3600)),
+            }
+        except Exception:
+            return None
 
 
 # Global instance
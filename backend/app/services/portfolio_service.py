@@ -5,9 +5,17 @@ Portfolio Service - Core portfolio analysis logic
 from datetime import datetime
 from app.models.holding import Holding
 from app.models.portfolio import PortfolioAnalysis, RiskBreakdown
-from app.models.common import Warning, Recommendation, BlindSpot
+from app.models.common import (
+    Warning,
+    WarningSeverity,
+    WarningType,
+    Recommendation,
+    RecommendationAction,
+    BlindSpot,
+    BlindSpotType,
+)
 from app.services.market_data_service import get_market_data_service
-from app.core.allocation import calculate_allocation
+from app.core.allocation import calculate_allocation, get_sector, holding_weights
 from app.core.scoring import calculate_risk_score
 
 
@@ -55,21 +63,35 @@ class PortfolioService:
         # Calculate allocations
         asset_class_allocation, sector_allocation = calculate_allocation(holdings, prices)
         
+        # Each holding's share of the portfolio (%), in holdings order
+        weights = holding_weights(holdings, prices)
+        
         # Calculate risk score
-        risk_score, risk_breakdown = calculate_risk_score(holdings, prices)
+        risk_score, risk_breakdown = calculate_risk_score(
+            holdings, prices, (asset_class_allocation, sector_allocation), weights
+        )
+        
+        # Group holdings by sector once for the checks below
+        sector_holdings: dict[str, list[Holding]] = {}
+        for h in holdings:
+            sector_holdings.setdefault(get_sector(h.symbol, h.asset_class), []).append(h)
         
         # Generate warnings (imported from risk service logic)
-        warnings = self._generate_warnings(holdings, prices, sector_allocation, asset_class_allocation)
+        warnings = self._generate_warnings(
+            holdings, weights, sector_allocation, asset_class_allocation, sector_holdings
+        )
         
         # Generate blind spots (imported from blind spot service logic)
-        blind_spots = self._detect_blind_spots(holdings, sector_allocation)
+        blind_spots = self._detect_blind_spots(sector_allocation, sector_holdings)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            holdings, prices, sector_allocation, asset_class_allocation
+            holdings, prices, weights, sector_allocation, sector_holdings
         )
         
-        return PortfolioAnalysis(
+        # All fields are computed here from validated holdings, so skip
+        # re-running validators on the response model
+        return PortfolioAnalysis.model_construct(
             total_value=round(total_value, 2),
             total_cost_basis=round(total_cost_basis, 2),
             total_gain_loss=round(total_gain_loss, 2),
@@ -77,7 +99,7 @@ class PortfolioService:
             allocation=asset_class_allocation,
             sector_allocation=sector_allocation,
             risk_score=risk_score,
-            risk_breakdown=RiskBreakdown(**risk_breakdown),
+            risk_breakdown=RiskBreakdown.model_construct(**risk_breakdown),
             warnings=warnings,
             recommendations=recommendations,
             blind_spots=blind_spots,
@@ -87,32 +109,22 @@ class PortfolioService:
     def _generate_warnings(
         self,
         holdings: list[Holding],
-        prices: dict[str, float],
+        weights: list[float],
         sector_allocation: dict[str, float],
-        asset_class_allocation: dict[str, float]
+        asset_class_allocation: dict[str, float],
+        sector_holdings: dict[str, list[Holding]]
     ) -> list[Warning]:
         """Generate warnings based on concentration thresholds"""
-        from app.models.common import WarningSeverity, WarningType
-        
         warnings = []
         
-        # Calculate total value
-        total_value = sum(
-            h.quantity * prices.get(h.symbol, h.purchase_price)
-            for h in holdings
-        )
-        
-        if total_value == 0:
+        if not weights:
             return warnings
         
         # Check sector concentration
         for sector, pct in sector_allocation.items():
             if pct > 40:
-                affected = [
-                    h.symbol for h in holdings
-                    if self._get_sector(h.symbol, h.asset_class) == sector
-                ]
-                warnings.append(Warning(
+                affected = [h.symbol for h in sector_holdings.get(sector, [])]
+                warnings.append(Warning.model_construct(
                     type=WarningType.SECTOR_CONCENTRATION,
                     severity=WarningSeverity.CRITICAL,
                     message=f"Portfolio is {pct:.1f}% exposed to {sector} sector",
@@ -120,11 +132,8 @@ class PortfolioService:
                     affected_symbols=affected,
                 ))
             elif pct > 25:
-                affected = [
-                    h.symbol for h in holdings
-                    if self._get_sector(h.symbol, h.asset_class) == sector
-                ]
-                warnings.append(Warning(
+                affected = [h.symbol for h in sector_holdings.get(sector, [])]
+                warnings.append(Warning.model_construct(
                     type=WarningType.SECTOR_CONCENTRATION,
                     severity=WarningSeverity.MEDIUM,
                     message=f"{sector} sector represents {pct:.1f}% of portfolio",
@@ -133,12 +142,9 @@ class PortfolioService:
                 ))
         
         # Check single stock concentration
-        for holding in holdings:
-            value = holding.quantity * prices.get(holding.symbol, holding.purchase_price)
-            pct = (value / total_value) * 100
-            
+        for holding, pct in zip(holdings, weights):
             if pct > 20:
-                warnings.append(Warning(
+                warnings.append(Warning.model_construct(
                     type=WarningType.SINGLE_STOCK,
                     severity=WarningSeverity.CRITICAL,
                     message=f"{holding.symbol} represents {pct:.1f}% of portfolio",
@@ -146,7 +152,7 @@ class PortfolioService:
                     affected_symbols=[holding.symbol],
                 ))
             elif pct > 10:
-                warnings.append(Warning(
+                warnings.append(Warning.model_construct(
                     type=WarningType.SINGLE_STOCK,
                     severity=WarningSeverity.MEDIUM,
                     message=f"{holding.symbol} represents {pct:.1f}% of portfolio",
@@ -157,7 +163,7 @@ class PortfolioService:
         # Check asset class imbalance
         for asset_class, pct in asset_class_allocation.items():
             if pct > 80:
-                warnings.append(Warning(
+                warnings.append(Warning.model_construct(
                     type=WarningType.ASSET_CLASS_IMBALANCE,
                     severity=WarningSeverity.MEDIUM,
                     message=f"Portfolio is {pct:.1f}% {asset_class}",
@@ -167,30 +173,19 @@ class PortfolioService:
         
         return warnings
     
-    def _get_sector(self, symbol: str, asset_class: str) -> str:
-        """Get sector for a symbol"""
-        from app.core.allocation import get_sector
-        sector = get_sector(symbol, asset_class)
-        return sector or "Other"
-    
     def _detect_blind_spots(
         self,
-        holdings: list[Holding],
-        sector_allocation: dict[str, float]
+        sector_allocation: dict[str, float],
+        sector_holdings: dict[str, list[Holding]]
     ) -> list[BlindSpot]:
         """Detect blind spots using rules-based approach"""
-        from app.models.common import BlindSpotType
-        
         blind_spots = []
         
         # Rule 1: Style concentration (tech-heavy = large-cap growth proxy)
         tech_pct = sector_allocation.get('Technology', 0)
         if tech_pct > 60:
-            affected = [
-                h.symbol for h in holdings
-                if self._get_sector(h.symbol, h.asset_class) == 'Technology'
-            ]
-            blind_spots.append(BlindSpot(
+            affected = [h.symbol for h in sector_holdings.get('Technology', [])]
+            blind_spots.append(BlindSpot.model_construct(
                 type=BlindSpotType.STYLE_CONCENTRATION,
                 confidence=min(95, 60 + int((tech_pct - 60) * 1.75)),
                 message="Portfolio heavily tilted toward large-cap growth stocks",
@@ -199,16 +194,10 @@ class PortfolioService:
             ))
         
         # Rule 2: Hidden sector concentration (3+ holdings in same sector)
-        sector_holdings = {}
-        for h in holdings:
-            sector = self._get_sector(h.symbol, h.asset_class)
-            if sector not in sector_holdings:
-                sector_holdings[sector] = []
-            sector_holdings[sector].append(h.symbol)
-        
-        for sector, symbols in sector_holdings.items():
-            if len(symbols) >= 3 and sector_allocation.get(sector, 0) > 40:
-                blind_spots.append(BlindSpot(
+        for sector, members in sector_holdings.items():
+            if len(members) >= 3 and sector_allocation.get(sector, 0) > 40:
+                symbols = [h.symbol for h in members]
+                blind_spots.append(BlindSpot.model_construct(
                     type=BlindSpotType.HIDDEN_CORRELATION,
                     confidence=75,
                     message=f"High concentration in {sector} sector with {len(symbols)} holdings",
@@ -222,39 +211,29 @@ class PortfolioService:
         self,
         holdings: list[Holding],
         prices: dict[str, float],
+        weights: list[float],
         sector_allocation: dict[str, float],
-        asset_class_allocation: dict[str, float]
+        sector_holdings: dict[str, list[Holding]]
     ) -> list[Recommendation]:
         """Generate rebalancing recommendations"""
-        from app.models.common import RecommendationAction
-        
         recommendations = []
         
-        # Calculate total value
-        total_value = sum(
-            h.quantity * prices.get(h.symbol, h.purchase_price)
-            for h in holdings
-        )
-        
-        if total_value == 0:
+        if not weights:
             return recommendations
         
         # Find over-exposed sectors (>40%)
         for sector, pct in sector_allocation.items():
             if pct > 40:
                 # Find largest holding in this sector
-                sector_holdings = [
-                    h for h in holdings
-                    if self._get_sector(h.symbol, h.asset_class) == sector
-                ]
-                if sector_holdings:
+                members = sector_holdings.get(sector)
+                if members:
                     largest = max(
-                        sector_holdings,
+                        members,
                         key=lambda h: h.quantity * prices.get(h.symbol, h.purchase_price)
                     )
                     sell_qty = int(largest.quantity * 0.2)  # Suggest selling 20%
                     if sell_qty > 0:
-                        recommendations.append(Recommendation(
+                        recommendations.append(Recommendation.model_construct(
                             action=RecommendationAction.SELL,
                             symbol=largest.symbol,
                             quantity=float(sell_qty),
@@ -264,14 +243,11 @@ class PortfolioService:
                         ))
         
         # Find over-exposed single stocks (>15%)
-        for holding in holdings:
-            value = holding.quantity * prices.get(holding.symbol, holding.purchase_price)
-            pct = (value / total_value) * 100
-            
+        for holding, pct in zip(holdings, weights):
             if pct > 15:
                 sell_qty = int(holding.quantity * 0.3)  # Suggest selling 30%
                 if sell_qty > 0:
-                    recommendations.append(Recommendation(
+                    recommendations.append(Recommendation.model_construct(
                         action=RecommendationAction.SELL,
                         symbol=holding.symbol,
                         quantity=float(sell_qty),
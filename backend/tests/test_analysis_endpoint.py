@@ -0,0 +1,92 @@
+"""
+Test analysis endpoint caching
+"""
+
+import pytest
+from datetime import timedelta
+from app.api.v1 import analysis, portfolio as portfolio_routes
+from app.api.v1.portfolio import HoldingImport
+from app.services.auth import TokenData
+from app.services.database import InMemoryDB
+from app.services.portfolio_service import PortfolioService
+
+
+@pytest.fixture
+def analysis_db(monkeypatch):
+    """Fresh database and empty analysis cache, counting analyze() calls"""
+    db = InMemoryDB()
+    calls = []
+    analyze = PortfolioService.analyze
+
+    async def counting_analyze(self, holdings):
+        calls.append([h.symbol for h in holdings])
+        return await analyze(self, holdings)
+
+    monkeypatch.setattr(analysis, "db", db)
+    monkeypatch.setattr(portfolio_routes, "db", db)
+    monkeypatch.setattr(analysis, "_analysis_cache", {})
+    monkeypatch.setattr(PortfolioService, "analyze", counting_analyze)
+    return db, calls
+
+
+@pytest.mark.asyncio
+async def test_analysis_reused_until_holdings_change(analysis_db):
+    """Test unchanged holdings reuse the analysis and replaced holdings recompute it"""
+    db, calls = analysis_db
+    user = TokenData(user_id="user-1", email="a@example.com")
+    portfolio = await db.portfolio_create(user.user_id, "My Portfolio")
+    await db.holding_replace_many(portfolio.id, [
+        {"symbol": "AAPL", "quantity": 10, "purchasePrice": 150.00},
+    ])
+
+    first = await analysis.analyze_portfolio(current_user=user)
+    second = await analysis.analyze_portfolio(current_user=user)
+
+    assert second is first
+    assert calls == [["AAPL"]]
+
+    await db.holding_replace_many(portfolio.id, [
+        {"symbol": "MSFT", "quantity": 5, "purchasePrice": 280.00},
+    ])
+    third = await analysis.analyze_portfolio(current_user=user)
+
+    assert third is not first
+    assert calls == [["AAPL"], ["MSFT"]]
+
+
+@pytest.mark.asyncio
+async def test_expired_analyses_are_evicted(analysis_db):
+    """Test expired cache entries are dropped on the next request"""
+    db, _ = analysis_db
+    users = [TokenData(user_id=f"user-{i}", email=f"{i}@example.com") for i in range(2)]
+    for user in users:
+        portfolio = await db.portfolio_create(user.user_id, "My Portfolio")
+        await db.holding_replace_many(portfolio.id, [
+            {"symbol": "AAPL", "quantity": 10, "purchasePrice": 150.00},
+        ])
+
+    await analysis.analyze_portfolio(current_user=users[0])
+    for key, (version, cached_at, result) in analysis._analysis_cache.items():
+        analysis._analysis_cache[key] = (
+            version, cached_at - timedelta(seconds=analysis._ANALYSIS_TTL), result
+        )
+    await analysis.analyze_portfolio(current_user=users[1])
+
+    portfolio = await db.portfolio_find_by_user(users[1].user_id)
+    assert list(analysis._analysis_cache) == [portfolio.id]
+
+
+@pytest.mark.asyncio
+async def test_imported_unknown_asset_class_can_be_analyzed(analysis_db):
+    """Test imported rows with an unknown asset class are stored as stock"""
+    db, calls = analysis_db
+    user = TokenData(user_id="user-1", email="a@example.com")
+
+    await portfolio_routes.import_portfolio(
+        [HoldingImport(symbol="agg", quantity=10, purchase_price=100.00, asset_class="bond")],
+        current_user=user,
+    )
+    result = await analysis.analyze_portfolio(current_user=user)
+
+    assert calls == [["AGG"]]
+    assert result.allocation == {"stock": 100.0}
@@ -0,0 +1,46 @@
+"""
+Test allocation calculations
+"""
+
+from app.models.holding import Holding
+from app.core.allocation import get_sector, calculate_allocation, holding_weights
+
+
+def test_get_sector():
+    """Test sector lookup and asset-class fallbacks"""
+    assert get_sector("aapl") == "Technology"
+    assert get_sector("QQQ", "etf") == "Technology"
+    assert get_sector("VTI", "etf") == "Broad Market"
+    assert get_sector("BTC", "crypto") == "Cryptocurrency"
+    assert get_sector("UNKNOWN") == "Other"
+
+
+def test_calculate_allocation():
+    """Test asset class and sector allocation percentages"""
+    holdings = [
+        Holding(symbol="AAPL", quantity=10, purchase_price=100.00),
+        Holding(symbol="JPM", quantity=10, purchase_price=100.00),
+        Holding(symbol="VTI", quantity=20, purchase_price=100.00, asset_class="etf"),
+    ]
+    prices = {"AAPL": 100.00, "JPM": 100.00}
+
+    asset_class_allocation, sector_allocation = calculate_allocation(holdings, prices)
+
+    assert asset_class_allocation == {"stock": 50.0, "etf": 50.0}
+    assert sector_allocation == {"Technology": 25.0, "Financial": 25.0, "Broad Market": 50.0}
+
+
+def test_calculate_allocation_empty():
+    """Test allocation of an empty portfolio"""
+    assert calculate_allocation([], {}) == ({}, {})
+
+
+def test_holding_weights():
+    """Test per-holding weights, falling back to purchase price"""
+    holdings = [
+        Holding(symbol="AAPL", quantity=10, purchase_price=100.00),
+        Holding(symbol="JPM", quantity=30, purchase_price=100.00),
+    ]
+
+    assert holding_weights(holdings, {"AAPL": 100.00}) == [25.0, 75.0]
+    assert holding_weights([], {}) == []
@@ -4,7 +4,12 @@ Test risk scoring algorithms
 
 import pytest
 from app.models.holding import Holding
-from app.core.scoring import calculate_risk_score, calculate_concentration_risk
+from app.core.allocation import calculate_allocation
+from app.core.scoring import (
+    calculate_risk_score,
+    calculate_concentration_risk,
+    calculate_volatility_risk,
+)
 
 
 def test_single_stock_concentration():
@@ -79,3 +84,36 @@ def test_risk_score_range():
         risk_score, _ = calculate_risk_score(holdings, prices)
         
         assert 0 <= risk_score <= 100
+
+
+def test_risk_score_with_precomputed_allocation():
+    """Test that a precomputed allocation gives the same score"""
+    holdings = [
+        Holding(symbol="AAPL", quantity=50, purchase_price=150.00),
+        Holding(symbol="JPM", quantity=20, purchase_price=140.00),
+    ]
+    prices = {"AAPL": 150.00, "JPM": 140.00}
+
+    expected = calculate_risk_score(holdings, prices)
+    allocation = calculate_allocation(holdings, prices)
+
+    assert calculate_risk_score(holdings, prices, allocation) == expected
+
+
+def test_component_scores_with_precomputed_weights():
+    """Test that precomputed holding weights give the same component scores"""
+    holdings = [
+        Holding(symbol="AAPL", quantity=50, purchase_price=150.00),
+        Holding(symbol="BTC", quantity=1, purchase_price=40000.00, asset_class="crypto"),
+    ]
+    prices = {"AAPL": 150.00, "BTC": 40000.00}
+    asset_class_allocation, sector_allocation = calculate_allocation(holdings, prices)
+    weights = [100 * 7500 / 47500, 100 * 40000 / 47500]
+
+    assert calculate_concentration_risk(
+        asset_class_allocation, sector_allocation, holdings, prices, weights
+    ) == calculate_concentration_risk(asset_class_allocation, sector_allocation, holdings, prices)
+    assert calculate_volatility_risk(holdings, prices, weights) == calculate_volatility_risk(holdings, prices)
+    assert calculate_risk_score(
+        holdings, prices, (asset_class_allocation, sector_allocation), weights
+    ) == calculate_risk_score(holdings, prices)
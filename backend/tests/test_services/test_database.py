@@ -0,0 +1,91 @@
+"""
+Test in-memory database
+"""
+
+import pytest
+from datetime import datetime
+from app.services.database import InMemoryDB
+
+
+@pytest.mark.asyncio
+async def test_holdings_scoped_to_portfolio():
+    """Test that holdings are looked up and deleted per portfolio"""
+    db = InMemoryDB()
+    await db.holding_create("p1", "aapl", 10, 150.00)
+    await db.holding_create("p1", "MSFT", 5, 280.00)
+    await db.holding_create("p2", "GOOGL", 2, 140.00)
+
+    holdings = await db.holding_find_by_portfolio("p1")
+    assert sorted(h.symbol for h in holdings) == ["AAPL", "MSFT"]
+
+    await db.holding_delete_by_portfolio("p1")
+
+    assert await db.holding_find_by_portfolio("p1") == []
+    assert len(await db.holding_find_by_portfolio("p2")) == 1
+    assert len(db.holdings) == 1
+
+
+@pytest.mark.asyncio
+async def test_portfolio_find_with_holdings():
+    """Test combined portfolio + holdings lookup"""
+    db = InMemoryDB()
+    portfolio, holdings = await db.portfolio_find_with_holdings("user-1")
+    assert portfolio is None
+    assert holdings == []
+
+    created = await db.portfolio_create("user-1", "My Portfolio")
+    await db.holding_create(created.id, "AAPL", 10, 150.00)
+
+    portfolio, holdings = await db.portfolio_find_with_holdings("user-1")
+    assert portfolio.id == created.id
+    assert [h.symbol for h in holdings] == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_indexed_lookups():
+    """Test email, session token and OAuth account lookups"""
+    db = InMemoryDB()
+    user = await db.user_create("a@example.com", "hash", "A")
+    assert await db.user_find_by_email("a@example.com") is user
+    assert await db.user_find_by_email("b@example.com") is None
+
+    await db.session_create(user.id, "token-1", user.createdAt)
+    assert (await db.session_find_by_token("token-1")).userId == user.id
+    await db.session_delete_many(user.id)
+    assert await db.session_find_by_token("token-1") is None
+    assert db.sessions == {}
+
+    account = await db.account_create(user.id, "github", "42")
+    assert await db.account_find_by_provider_and_id("github", "42") is account
+    assert await db.account_find_by_provider_and_id("google", "42") is None
+    assert await db.account_find_by_user(user.id) == [account]
+
+
+@pytest.mark.asyncio
+async def test_audit_log_find_by_user_limit():
+    """Test audit logs are returned newest first and limited"""
+    db = InMemoryDB()
+    for i in range(5):
+        log = await db.audit_log_create("user-1", f"action-{i}")
+        log.timestamp = datetime(2024, 1, 1, 0, 0, i)
+    await db.audit_log_create("user-2", "other")
+
+    logs = await db.audit_log_find_by_user("user-1", limit=3)
+    assert [log.action for log in logs] == ["action-4", "action-3", "action-2"]
+
+
+@pytest.mark.asyncio
+async def test_holding_replace_many():
+    """Test replacing a portfolio's holdings leaves other portfolios alone"""
+    db = InMemoryDB()
+    await db.holding_create("p1", "AAPL", 10, 150.00)
+    await db.holding_create("p2", "GOOGL", 2, 140.00)
+
+    replaced = await db.holding_replace_many("p1", [
+        {"symbol": "MSFT", "quantity": 5, "purchasePrice": 280.00},
+    ])
+
+    assert await db.holding_find_by_portfolio("p1") == replaced
+    assert [h.symbol for h in replaced] == ["MSFT"]
+    assert len(await db.holding_find_by_portfolio("p2")) == 1
+    assert len(db.holdings) == 2
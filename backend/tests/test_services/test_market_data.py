@@ -0,0 +1,105 @@
+"""
+Test market data service
+"""
+
+import asyncio
+import pytest
+from datetime import timedelta
+from app.services.market_data_service import MarketDataService
+
+
+class FakeMarketDataService(MarketDataService):
+    """Market data service with a canned price table instead of yfinance"""
+
+    def __init__(self, table: dict[str, float]):
+        super().__init__()
+        self.table = table
+        self.calls: list[str] = []
+
+    def _fetch_price(self, symbol: str):
+        self.calls.append(symbol)
+        return self.table.get(symbol)
+
+
+@pytest.mark.asyncio
+async def test_get_prices_fetches_and_caches():
+    """Test prices are fetched once and then served from cache"""
+    service = FakeMarketDataService({"AAPL": 180.0, "MSFT": 400.0})
+
+    prices = await service.get_prices(["AAPL", "MSFT", "NOPE"])
+
+    assert prices == {"AAPL": 180.0, "MSFT": 400.0, "NOPE": None}
+    assert list(prices) == ["AAPL", "MSFT", "NOPE"]
+    assert service.get_cache_size() == 2
+
+    await service.get_prices(["AAPL", "MSFT"])
+
+    assert sorted(service.calls) == ["AAPL", "MSFT", "NOPE"]
+
+
+@pytest.mark.asyncio
+async def test_get_prices_fetches_duplicates_once():
+    """Test a symbol repeated in the request is only fetched once"""
+    service = FakeMarketDataService({"AAPL": 180.0})
+
+    prices = await service.get_prices(["AAPL", "AAPL", "NOPE", "NOPE"])
+
+    assert prices == {"AAPL": 180.0, "NOPE": None}
+    assert sorted(service.calls) == ["AAPL", "NOPE"]
+
+
+@pytest.mark.asyncio
+async def test_get_prices_skips_recently_missing_symbols():
+    """Test symbols with no price are not fetched again within the TTL"""
+    service = FakeMarketDataService({"AAPL": 180.0})
+
+    await service.get_prices(["NOPE"])
+    prices = await service.get_prices(["AAPL", "NOPE"])
+
+    assert prices == {"AAPL": 180.0, "NOPE": None}
+    assert sorted(service.calls) == ["AAPL", "NOPE"]
+
+    service.missing_ttl = 0
+    await service.get_prices(["NOPE"])
+
+    assert service.calls.count("NOPE") == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_missing_symbols_are_pruned():
+    """Test expired negative-cache entries are dropped even if never requested again"""
+    service = FakeMarketDataService({})
+
+    await service.get_prices(["OLD1", "OLD2"])
+    for symbol in service.missing:
+        service.missing[symbol] -= timedelta(seconds=service.missing_ttl)
+    await service.get_prices(["NEW"])
+
+    assert list(service.missing) == ["NEW"]
+
+
+@pytest.mark.asyncio
+async def test_get_price_uses_cache():
+    """Test single-symbol lookups share the price cache"""
+    service = FakeMarketDataService({"AAPL": 180.0})
+
+    assert await service.get_price("AAPL") == 180.0
+    assert await service.get_price("AAPL") == 180.0
+    assert await service.get_price("NOPE") is None
+    assert service.calls == ["AAPL", "NOPE"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_fetch():
+    """Test concurrent lookups of the same symbol share one in-flight fetch"""
+    service = FakeMarketDataService({"AAPL": 180.0})
+
+    first, second = await asyncio.gather(
+        service.get_prices(["AAPL"]),
+        service.get_prices(["AAPL", "MSFT"]),
+    )
+
+    assert first == {"AAPL": 180.0}
+    assert second == {"AAPL": 180.0, "MSFT": None}
+    assert sorted(service.calls) == ["AAPL", "MSFT"]
+    assert service._inflight == {}
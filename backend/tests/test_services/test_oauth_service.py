@@ -0,0 +1,59 @@
+"""
+Test OAuth service
+"""
+
+import httpx
+import pytest
+from app.services.oauth_service import OAuthService
+
+
+def make_service(requests: list[httpx.Request]) -> OAuthService:
+    """OAuth service whose shared transport answers with canned responses"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/token"):
+            return httpx.Response(200, json={
+                "access_token": "access",
+                "refresh_token": "refresh",
+                "token_type": "Bearer",
+                "expires_in": 3600,
+            })
+        return httpx.Response(200, json={
+            "id": "42",
+            "email": "a@example.com",
+            "name": "A",
+            "verified_email": True,
+        })
+
+    service = OAuthService()
+    service._transport = httpx.MockTransport(handler)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_exchange_google_code_uses_shared_transport():
+    """Test the token exchange and user info lookup share one transport"""
+    requests = []
+    service = make_service(requests)
+
+    data = await service.exchange_google_code("abc")
+
+    assert [r.url.host for r in requests] == ["oauth2.googleapis.com", "www.googleapis.com"]
+    assert b"code=abc" in requests[0].content
+    assert data["provider_account_id"] == "42"
+    assert data["access_token"] == "access"
+
+
+@pytest.mark.asyncio
+async def test_refresh_google_token_uses_shared_transport():
+    """Test token refreshes go through the shared transport"""
+    requests = []
+    service = make_service(requests)
+
+    token = await service.refresh_google_token("refresh")
+
+    assert len(requests) == 1
+    assert token["access_token"] == "access"
+
+    await service.aclose()
+    assert service._transport is None
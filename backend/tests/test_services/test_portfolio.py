@@ -70,3 +70,22 @@ def test_holding_validation():
     # Invalid: zero price
     with pytest.raises(Exception):
         Holding(symbol="AAPL", quantity=50, purchase_price=0)
+
+
+@pytest.mark.asyncio
+async def test_portfolio_sector_blind_spots():
+    """Test sector warnings and blind spots list the holdings in that sector"""
+    holdings = [
+        Holding(symbol="AAPL", quantity=10, purchase_price=100.00),
+        Holding(symbol="MSFT", quantity=10, purchase_price=100.00),
+        Holding(symbol="NVDA", quantity=10, purchase_price=100.00),
+    ]
+    
+    service = PortfolioService()
+    analysis = await service.analyze(holdings)
+    
+    assert analysis.blind_spots
+    for blind_spot in analysis.blind_spots:
+        assert sorted(blind_spot.affected_symbols) == ["AAPL", "MSFT", "NVDA"]
+    sector_warnings = [w for w in analysis.warnings if w.details.get("sector") == "Technology"]
+    assert sorted(sector_warnings[0].affected_symbols) == ["AAPL", "MSFT", "NVDA"]